@@ -1,8 +1,24 @@
 import cv2 as cv
 import mediapipe as mp
 import numpy as np
-import pandas as pd
+import multiprocessing
 import os
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+# Numba is an optional dependency; when available, the per-frame pixel kernels are
+# JIT-compiled into single fused passes over the frame
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# OpenCV's FFmpeg backend reads encoder options from the environment when a
+# VideoWriter is constructed; requesting multi-threaded encoding up front lets
+# every writer in the module spread encoding across the available cores
+os.environ.setdefault("OPENCV_FFMPEG_WRITER_OPTIONS", f"threads;{os.cpu_count()}")
 
 # Defining pertinent facemesh landmark sets
 LEFT_EYE_IDX = [301, 334, 296, 336, 285, 413, 464, 453, 452, 451, 450, 449, 448, 261, 265, 383, 301]
@@ -13,49 +29,372 @@ LIPS_IDX = [164, 393, 391, 322, 410, 287, 273, 335, 406, 313, 18, 83, 182, 106,
 FACE_OVAL_IDX = [10, 338, 297, 332, 284, 251, 389, 356, 345, 352, 376, 433, 397, 365, 379, 378, 400, 377, 
             152, 148, 176, 149, 150, 136, 172, 213, 147, 123, 116, 127, 162, 21, 54, 103, 67, 109, 10]
 
-def create_path(landmark_set):
-    """Creates a list of interconnected points, given a set of facial landmark indicies.
-    
-    Args: 
-        landmark_set: a python list containing facial landmark indicies.
-    
-    Returns:
-        routes: a list of tuples containing overlapping points, forming a path."""
-    
-    # Connvert the input list to a two-column dataframe
-    landmark_dataframe = pd.DataFrame([(landmark_set[i], landmark_set[i+1]) for i in range(len(landmark_set) - 1)], columns=['p1', 'p2'])
-    routes = []
+# The index lists above are already stored in path order, so each region path is
+# simply the tuple of adjacent (source, target) landmark pairs
+LEFT_EYE_PATH = tuple(zip(LEFT_EYE_IDX, LEFT_EYE_IDX[1:]))
+LEFT_CHEEK_PATH = tuple(zip(LEFT_CHEEK_IDX, LEFT_CHEEK_IDX[1:]))
+RIGHT_EYE_PATH = tuple(zip(RIGHT_EYE_IDX, RIGHT_EYE_IDX[1:]))
+RIGHT_CHEEK_PATH = tuple(zip(RIGHT_CHEEK_IDX, RIGHT_CHEEK_IDX[1:]))
+LIPS_PATH = tuple(zip(LIPS_IDX, LIPS_IDX[1:]))
+FACE_OVAL_PATH = tuple(zip(FACE_OVAL_IDX, FACE_OVAL_IDX[1:]))
+
+# Precomputed contour index arrays used to gather landmark screen coordinates with
+# a single NumPy indexing operation per region. The last index of each landmark set
+# is dropped, as it only closes the ring (a duplicate of the first index), so each
+# gathered contour holds exactly one entry per polygon vertex, in path order --
+# fillConvexPoly never sees a vertex twice.
+LEFT_EYE_IDX_ARR = np.asarray(LEFT_EYE_IDX[:-1], dtype=np.int32)
+LEFT_CHEEK_IDX_ARR = np.asarray(LEFT_CHEEK_IDX[:-1], dtype=np.int32)
+RIGHT_EYE_IDX_ARR = np.asarray(RIGHT_EYE_IDX[:-1], dtype=np.int32)
+RIGHT_CHEEK_IDX_ARR = np.asarray(RIGHT_CHEEK_IDX[:-1], dtype=np.int32)
+LIPS_IDX_ARR = np.asarray(LIPS_IDX[:-1], dtype=np.int32)
+FACE_OVAL_IDX_ARR = np.asarray(FACE_OVAL_IDX[:-1], dtype=np.int32)
 
-    # Initialise the first two points
-    p1 = landmark_dataframe.iloc[0]['p1']
-    p2 = landmark_dataframe.iloc[0]['p2']
+FACE_OVAL = 1
+FACE_SKIN_ISOLATION = 2
+MASK_OPTIONS = [FACE_OVAL, FACE_SKIN_ISOLATION]
 
-    for i in range(0, landmark_dataframe.shape[0]):
-        obj = landmark_dataframe[landmark_dataframe['p1'] == p2]
-        p1 = obj['p1'].values[0]
-        p2 = obj['p2'].values[0]
+def _open_capture(file):
+    """Opens a video capture on the FFmpeg backend, requesting hardware-accelerated
+    decoding; OpenCV falls back to software decode when no accelerator is found."""
 
-        current_route = [p1, p2]
-        routes.append(current_route)
-    
-    return routes
+    return cv.VideoCapture(file, cv.CAP_FFMPEG, 
+                           [cv.CAP_PROP_HW_ACCELERATION, cv.VIDEO_ACCELERATION_ANY])
 
-LEFT_EYE_PATH = create_path(LEFT_EYE_IDX)
-LEFT_CHEEK_PATH = create_path(LEFT_CHEEK_IDX)
-RIGHT_EYE_PATH = create_path(RIGHT_EYE_IDX)
-RIGHT_CHEEK_PATH = create_path(RIGHT_CHEEK_IDX)
-LIPS_PATH = create_path(LIPS_IDX)
-FACE_OVAL_PATH = create_path(FACE_OVAL_IDX)
+def _frame_reader(capture, frame_queue):
+    """Reader thread target; decodes frames from capture into frame_queue as
+    (timestamp, frame) pairs, putting a None sentinel once the end of the stream
+    is reached. The timestamp is read right beside the decode: the reader runs
+    frames ahead of the consumer, and the capture is not safe to touch from any
+    other thread, so querying it later would return the wrong position."""
+
+    while True:
+        success, frame = capture.read()
+        if not success:
+            break
+        frame_queue.put((capture.get(cv.CAP_PROP_POS_MSEC)/1000, frame))
+    frame_queue.put(None)
+
+def _frame_writer(result, frame_queue, errors=None):
+    """Writer thread target; encodes frames from frame_queue until a None sentinel
+    is received. Entries may also be Future objects, which are resolved in queue
+    order, so frames are encoded in submission order even when produced out of
+    order. If resolving or encoding raises, the queue is still drained to its
+    sentinel -- producers must never block on a dead writer -- and the first
+    error is appended to errors for the producer to re-raise."""
+
+    error = None
+    while True:
+        frame = frame_queue.get()
+        if frame is None:
+            break
+        if error is not None:
+            continue
+        try:
+            if isinstance(frame, Future):
+                frame = frame.result()
+            result.write(frame)
+        except Exception as e:
+            error = e
+    if error is not None:
+        if errors is not None:
+            errors.append(error)
+        else:
+            raise error
+
+def _pin_thread_to_core(core_id):
+    """Pins the calling thread to a single core on platforms that support it,
+    keeping a pipeline stage from migrating between cores and losing its warm
+    cache. Set FACE_ISOLATION_NO_PIN in the environment to disable pinning, e.g.
+    in containerized deployments with restricted CPU sets."""
+
+    if hasattr(os, "sched_setaffinity") and not os.environ.get("FACE_ISOLATION_NO_PIN"):
+        os.sched_setaffinity(0, {core_id})
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _isolate_skin_kernel(frame, oval_mask, excl_mask, skin_mask, face_skin):
+        """Fused per-pixel kernel combining skin mask composition (face oval minus
+        exclusion regions minus near-white artifacts) with mask application, in a
+        single pass over the frame."""
+
+        h, w = oval_mask.shape
+        for y in prange(h):
+            for x in range(w):
+                b = frame[y, x, 0]
+                g = frame[y, x, 1]
+                r = frame[y, x, 2]
+                if oval_mask[y, x] != 0 and excl_mask[y, x] == 0 and not (b >= 220 and g >= 220 and r >= 220):
+                    skin_mask[y, x] = 255
+                    face_skin[y, x, 0] = b
+                    face_skin[y, x, 1] = g
+                    face_skin[y, x, 2] = r
+                else:
+                    skin_mask[y, x] = 0
+                    face_skin[y, x, 0] = 0
+                    face_skin[y, x, 1] = 0
+                    face_skin[y, x, 2] = 0
+
+    # The explicit signature compiles the kernel eagerly at import (or loads it
+    # from the on-disk cache), so no call-time type inference is needed; the
+    # non-contiguous array types also accept ROI views of a frame
+    @njit('void(uint8[:,:,:], uint8[:,:], int64, int64, int64, float64)',
+          parallel=True, fastmath=True, cache=True, nogil=True)
+    def _tint_kernel(frame, face_mask, b, g, r, alpha):
+        """Fused per-pixel tint kernel; adds alpha times the filter colour to the
+        masked pixels of frame in place with saturation -- the weights of the
+        original addWeighted(masked_img, alpha, frame, 1, 0) blend -- leaving
+        unmasked pixels untouched."""
+
+        h, w = face_mask.shape
+        for y in prange(h):
+            for x in range(w):
+                if face_mask[y, x] != 0:
+                    frame[y, x, 0] = np.uint8(min(frame[y, x, 0] + alpha * b + 0.5, 255.0))
+                    frame[y, x, 1] = np.uint8(min(frame[y, x, 1] + alpha * g + 0.5, 255.0))
+                    frame[y, x, 2] = np.uint8(min(frame[y, x, 2] + alpha * r + 0.5, 255.0))
 
-FACE_OVAL = 1
-FACE_SKIN_ISOLATION = 2 
-MASK_OPTIONS = [FACE_OVAL, FACE_SKIN_ISOLATION]
 
 COLOR_SPACE_RGB = cv.COLOR_BGR2RGB
 COLOR_SPACE_HSV = cv.COLOR_BGR2HSV
 COLOR_SPACE_GRAYSCALE = cv.COLOR_BGR2GRAY
 COLOR_SPACES = [COLOR_SPACE_RGB, COLOR_SPACE_HSV, COLOR_SPACE_GRAYSCALE]
 
+def _process_single_video(file, outputDirectory, maskType, colorSpace, extractColorInfo):
+    """Worker function containing the per-file body of mask_face_region; masks a
+    single video file and optionally extracts mean colour values. Each worker
+    constructs its own FaceMesh instance, as the underlying TFLite graph cannot be
+    shared across processes."""
+
+    global FACE_SKIN_ISOLATION
+    global LEFT_EYE_IDX_ARR
+    global RIGHT_EYE_IDX_ARR
+    global LIPS_IDX_ARR
+    global FACE_OVAL_IDX_ARR
+    global COLOR_SPACE_RGB
+    global COLOR_SPACE_HSV
+    global COLOR_SPACE_GRAYSCALE
+    with mp.solutions.face_mesh.FaceMesh(max_num_faces = 1, static_image_mode = False, 
+                                         min_detection_confidence = 0.25, min_tracking_confidence = 0.75) as face_mesh:
+
+        # Initialize capture and writer objects
+        filename, extension = os.path.splitext(os.path.basename(file))
+        capture = _open_capture(file)
+        size = (int(capture.get(3)), int(capture.get(4)))
+
+        if maskType == FACE_SKIN_ISOLATION:
+            result = cv.VideoWriter(os.path.join(outputDirectory, "Video_Output", filename + "_masked.mp4"),
+                                    cv.CAP_FFMPEG, cv.VideoWriter.fourcc(*'MP4V'), 30, size)
+        else:
+            result = cv.VideoWriter(os.path.join(outputDirectory, "Video_Output", filename + "_masked" + extension),
+                                    cv.CAP_FFMPEG, cv.VideoWriter.fourcc(*'MP4V'), 30, size)
+        csv = None
+        csv_rows = []
+
+        # The csv row formatters close over the stable per-file buffers, so the
+        # colorSpace dispatch happens once per file instead of once per frame
+        def _rgb_row(timestamp):
+            red, green, blue, *_ = cv.mean(rgb, skin_mask)
+            return f"{timestamp:.5f},{red:.5f},{green:.5f},{blue:.5f}\n"
+
+        def _face_rect():
+            # Bounding box of the face outline, clamped to the frame; landmarks can
+            # fall outside [0,1] when the face touches the frame edge, and a
+            # negative slice start would silently wrap around
+            x, y, w, h = cv.boundingRect(face_outline_coords)
+            x2, y2 = min(x + w, frame_w), min(y + h, frame_h)
+            x, y = max(x, 0), max(y, 0)
+            return x, y, x2 - x, y2 - y
+
+        def _hsv_row(timestamp):
+            # Converting only the face bounding box; pixels outside it are off-mask
+            # and ignored by cv.mean anyway
+            x, y, w, h = _face_rect()
+            roi = cv.cvtColor(frame[y:y+h, x:x+w], colorSpace)
+            hue, sat, val, *_ = cv.mean(roi, skin_mask[y:y+h, x:x+w])
+            return f"{timestamp:.5f},{hue:.5f},{sat:.5f},{val:.5f}\n"
+
+        def _gray_row(timestamp):
+            # Converting only the face bounding box; pixels outside it are off-mask
+            # and ignored by cv.mean anyway
+            x, y, w, h = _face_rect()
+            roi = cv.cvtColor(frame[y:y+h, x:x+w], colorSpace)
+            val, *_ = cv.mean(roi, skin_mask[y:y+h, x:x+w])
+            return f"{timestamp:.5f},{val:.5f}\n"
+
+        make_csv_row = None
+        if extractColorInfo == True:
+            if colorSpace == COLOR_SPACE_RGB:
+                csv = open(os.path.join(outputDirectory, "CSV_Output", filename + "_RGB.csv"), "w", buffering=1<<20)
+                csv.write("Timestamp,Red,Green,Blue\n")
+                make_csv_row = _rgb_row
+            elif colorSpace == COLOR_SPACE_HSV:
+                csv = open(os.path.join(outputDirectory, "CSV_Output", filename + "_HSV.csv"), "w", buffering=1<<20)
+                csv.write("Timestamp,Hue,Saturation,Value\n")
+                make_csv_row = _hsv_row
+            elif colorSpace == COLOR_SPACE_GRAYSCALE:
+                csv = open(os.path.join(outputDirectory, "CSV_Output", filename + "_GRAYSCALE.csv"), "w", buffering=1<<20)
+                csv.write("Timestamp,Value\n")
+                make_csv_row = _gray_row
+
+        # Preallocating the per-frame mask buffers once, using the capture dimensions;
+        # each buffer is cleared and reused across frames rather than reallocated
+        frame_w, frame_h = size
+        rgb = np.empty((frame_h, frame_w, 3), dtype=np.uint8)
+
+        # FaceMesh landmarks are normalised to [0,1], so detection can run on a
+        # downscaled copy without changing any of the pixel-coordinate math below
+        detect_rgb = None
+        if frame_w > 640:
+            detect_rgb = np.empty((int(frame_h * 640 / frame_w), 640, 3), dtype=np.uint8)
+        oval_mask = np.empty((frame_h, frame_w), dtype=np.uint8)
+        white_mask = np.empty((frame_h, frame_w), dtype=np.uint8)
+        skin_mask = np.empty((frame_h, frame_w), dtype=np.uint8)
+        if maskType == FACE_SKIN_ISOLATION:
+            le_mask = np.empty((frame_h, frame_w), dtype=np.uint8)
+            re_mask = np.empty((frame_h, frame_w), dtype=np.uint8)
+            lip_mask = np.empty((frame_h, frame_w), dtype=np.uint8)
+        else:
+            # All-zero exclusion mask standing in for the eye/mouth regions when
+            # only the face oval is masked
+            none_mask = np.zeros((frame_h, frame_w), dtype=np.uint8)
+
+        if NUMBA_AVAILABLE:
+            # Paying the one-time JIT compilation cost on a tiny input, before the
+            # timed per-frame work begins
+            _isolate_skin_kernel(np.zeros((2,2,3), np.uint8), np.zeros((2,2), np.uint8), 
+                                 np.zeros((2,2), np.uint8), np.empty((2,2), np.uint8), 
+                                 np.empty((2,2,3), np.uint8))
+
+        # Pipelining decode and encode on worker threads so that both overlap with
+        # landmark inference and masking
+        read_queue = queue.Queue(maxsize=8)
+        write_queue = queue.Queue(maxsize=8)
+        writer_errors = []
+        reader = threading.Thread(target=_frame_reader, args=(capture, read_queue))
+        writer = threading.Thread(target=_frame_writer, args=(result, write_queue, writer_errors))
+        reader.start()
+        writer.start()
+
+        # The pipeline threads must be unblocked and joined, and the handles
+        # released, even when the loop below raises; errors the writer hit while
+        # encoding are then re-raised here
+        eof = False
+        try:
+            while True:
+                item = read_queue.get()
+                if item is None:
+                    eof = True
+                    break
+                timestamp, frame = item
+
+                # The RGB conversion is done once into a preallocated buffer, and shared
+                # between FaceMesh and the RGB colour means below
+                cv.cvtColor(frame, cv.COLOR_BGR2RGB, rgb)
+                if detect_rgb is not None:
+                    cv.resize(rgb, (detect_rgb.shape[1], detect_rgb.shape[0]), detect_rgb, 
+                              interpolation=cv.INTER_AREA)
+                    face_mesh_results = face_mesh.process(detect_rgb)
+                else:
+                    face_mesh_results = face_mesh.process(rgb)
+
+                if not face_mesh_results.multi_face_landmarks:
+                    continue
+
+                # Convert normalised landmark coordinates to x-y pixel coordinates in one
+                # vectorized operation
+                ih, iw, ic = frame.shape
+                landmarks = face_mesh_results.multi_face_landmarks[0].landmark
+                pts_px = np.fromiter((c for lm in landmarks for c in (lm.x, lm.y)), 
+                                     dtype=np.float32, count=len(landmarks)*2).reshape(-1, 2)
+                pts_px *= (iw, ih)
+                pts_px = pts_px.astype(np.int32)
+
+                face_outline_coords = pts_px[FACE_OVAL_IDX_ARR]
+
+                oval_mask.fill(0)
+                cv.fillConvexPoly(oval_mask, face_outline_coords, 255)
+
+                if maskType == FACE_SKIN_ISOLATION:
+                    le_screen_coords = pts_px[LEFT_EYE_IDX_ARR]
+                    re_screen_coords = pts_px[RIGHT_EYE_IDX_ARR]
+                    lips_screen_coords = pts_px[LIPS_IDX_ARR]
+
+                    # Creating the masked regions; rasterize each region into a uint8 mask
+                    le_mask.fill(0)
+                    cv.fillConvexPoly(le_mask, le_screen_coords, 255)
+
+                    re_mask.fill(0)
+                    cv.fillConvexPoly(re_mask, re_screen_coords, 255)
+
+                    lip_mask.fill(0)
+                    cv.fillConvexPoly(lip_mask, lips_screen_coords, 255)
+
+                    # Merging the eye and mouth regions into a single exclusion mask
+                    cv.bitwise_or(le_mask, re_mask, le_mask)
+                    cv.bitwise_or(le_mask, lip_mask, le_mask)
+                    excl_mask = le_mask
+                else:
+                    excl_mask = none_mask
+
+                # The output frame is left as a fresh allocation per frame, as its
+                # ownership passes to the writer thread
+                if NUMBA_AVAILABLE:
+                    # Skin mask composition, white-artifact rejection and mask application
+                    # fused into one cache-friendly pass over the frame
+                    face_skin = np.empty_like(frame)
+                    _isolate_skin_kernel(frame, oval_mask, excl_mask, skin_mask, face_skin)
+                else:
+                    # Fusing the region masks into a single skin mask: face oval minus the
+                    # exclusion regions
+                    cv.bitwise_not(excl_mask, skin_mask)
+                    cv.bitwise_and(oval_mask, skin_mask, skin_mask)
+
+                    # Folding the face mesh artifact removal (near-white pixels) into the
+                    # skin mask, rather than scattering zeros in a separate pass
+                    cv.inRange(frame, (220,220,220), (255,255,255), white_mask)
+                    cv.bitwise_not(white_mask, white_mask)
+                    cv.bitwise_and(skin_mask, white_mask, skin_mask)
+
+                    # Applying the skin mask to the frame in a single pass; the masked
+                    # bitwise_and leaves off-mask destination pixels untouched, so the
+                    # output buffer must start zeroed
+                    face_skin = np.zeros_like(frame)
+                    cv.bitwise_and(frame, frame, face_skin, mask=skin_mask)
+
+                write_queue.put(face_skin)
+
+                # Extracting color values; rows are buffered and written in batches rather
+                # than one write per frame
+                if make_csv_row is not None:
+                    csv_rows.append(make_csv_row(timestamp))
+
+                    if len(csv_rows) >= 256:
+                        csv.write("".join(csv_rows))
+                        csv_rows.clear()
+
+            if csv_rows:
+                csv.write("".join(csv_rows))
+                csv_rows.clear()
+        finally:
+            if not eof:
+                # The loop exited early; drain the reader to its sentinel so it is
+                # never left blocked on a full queue
+                while read_queue.get() is not None:
+                    pass
+            write_queue.put(None)
+            reader.join()
+            writer.join()
+
+            capture.release()
+            result.release()
+            if csv is not None:
+                csv.close()
+
+        if writer_errors:
+            raise writer_errors[0]
+
 def mask_face_region(inputDirectory, outputDirectory, maskType = FACE_SKIN_ISOLATION, withSubDirectories = False,
                      extractColorInfo = False, colorSpace = COLOR_SPACE_RGB):
     """Processes video files contained within inputDirectory with selected mask of choice.
@@ -89,16 +428,14 @@ def mask_face_region(inputDirectory, outputDirectory, maskType = FACE_SKIN_ISOLA
     global MASK_OPTIONS
     global FACE_OVAL
     global FACE_SKIN_ISOLATION
-    global LEFT_EYE_PATH
-    global RIGHT_EYE_PATH
-    global LIPS_PATH
-    global FACE_OVAL_PATH
+    global LEFT_EYE_IDX_ARR
+    global RIGHT_EYE_IDX_ARR
+    global LIPS_IDX_ARR
+    global FACE_OVAL_IDX_ARR
     global COLOR_SPACE_RGB
     global COLOR_SPACE_HSV
     global COLOR_SPACE_GRAYSCALE
     global COLOR_SPACES
-    face_mesh = mp.solutions.face_mesh.FaceMesh(max_num_faces = 1, static_image_mode = False, 
-                                                min_detection_confidence = 0.25, min_tracking_confidence = 0.75)
 
     # Type and value checks for function parameters
     if not isinstance(inputDirectory, str):
@@ -126,243 +463,22 @@ def mask_face_region(inputDirectory, outputDirectory, maskType = FACE_SKIN_ISOLA
     # Creating a list of file names to iterate through when processing
     files_to_process = []
     if not withSubDirectories:
-         files_to_process = os.listdir(inputDirectory)
+         files_to_process = [os.path.join(inputDirectory, file) for file in os.listdir(inputDirectory)]
     else:
         files_to_process = [os.path.join(path, file) 
                             for path, dirs, files in os.walk(inputDirectory, topdown=True) 
                             for file in files]
     
     # Creating named output directories for video and csv output
-    if not os.path.isdir(outputDirectory + "\\Video_Output"):
-        os.mkdir(outputDirectory + "\\Video_Output")
-    if not os.path.isdir(outputDirectory + "\\CSV_Output"):
-        os.mkdir(outputDirectory + "\\CSV_Output")
-
-    if maskType == FACE_SKIN_ISOLATION:
-
-        for file in files_to_process:
-
-            # Initialize capture and writer objects
-            filename, extension = os.path.splitext(os.path.basename(file))
-            capture = cv.VideoCapture(file)
-            size = (int(capture.get(3)), int(capture.get(4)))
-            result = cv.VideoWriter(outputDirectory + "\\Video_Output\\" + filename + "_masked.mp4",
-                                    cv.VideoWriter.fourcc(*'MP4V'), 30, size)
-            csv = None
-            
-            if extractColorInfo == True:
-                if colorSpace == COLOR_SPACE_RGB:
-                    csv = open(outputDirectory + "\\CSV_Output\\" + filename + "_RGB.csv", "w")
-                    csv.write("Timestamp,Red,Green,Blue\n")
-                elif colorSpace == COLOR_SPACE_HSV:
-                    csv = open(outputDirectory + "\\CSV_Output\\" + filename + "_HSV.csv", "w")
-                    csv.write("Timestamp,Hue,Saturation,Value\n")
-                elif colorSpace == COLOR_SPACE_GRAYSCALE:
-                    csv = open(outputDirectory + "\\CSV_Output\\" + filename + "_GRAYSCALE.csv", "w")
-                    csv.write("Timestamp,Value\n")
-            
-            while True:
-                success, frame = capture.read()
-                if not success:
-                    break
-
-                face_mesh_results = face_mesh.process(cv.cvtColor(frame, cv.COLOR_BGR2RGB))
-                landmark_screen_coords = []
+    os.makedirs(os.path.join(outputDirectory, "Video_Output"), exist_ok=True)
+    os.makedirs(os.path.join(outputDirectory, "CSV_Output"), exist_ok=True)
 
-                if face_mesh_results.multi_face_landmarks:
-                    for face_landmarks in face_mesh_results.multi_face_landmarks:
-
-                        # Convert normalised landmark coordinates to x-y pixel coordinates
-                        for id,lm in enumerate(face_landmarks.landmark):
-                            ih, iw, ic = frame.shape
-                            x,y = int(lm.x * iw), int(lm.y * ih)
-                            landmark_screen_coords.append({'id':id, 'x':x, 'y':y})
-                else:
-                    continue
-
-                le_screen_coords = []
-                re_screen_coords = []
-                lips_screen_coords = []
-                face_outline_coords = []
-
-                # left eye screen coordinates
-                for cur_source, cur_target in LEFT_EYE_PATH:
-                    source = landmark_screen_coords[cur_source]
-                    target = landmark_screen_coords[cur_target]
-                    le_screen_coords.append((source.get('x'),source.get('y')))
-                    le_screen_coords.append((target.get('x'),target.get('y')))
-                
-                # right eye screen coordinates
-                for cur_source, cur_target in RIGHT_EYE_PATH:
-                    source = landmark_screen_coords[cur_source]
-                    target = landmark_screen_coords[cur_target]
-                    re_screen_coords.append((source.get('x'),source.get('y')))
-                    re_screen_coords.append((target.get('x'),target.get('y')))
-
-                # lips screen coordinates
-                for cur_source, cur_target in LIPS_PATH:
-                    source = landmark_screen_coords[cur_source]
-                    target = landmark_screen_coords[cur_target]
-                    lips_screen_coords.append((source.get('x'),source.get('y')))
-                    lips_screen_coords.append((target.get('x'),target.get('y')))
-                
-                # face oval screen coordinates
-                for cur_source, cur_target in FACE_OVAL_PATH:
-                    source = landmark_screen_coords[cur_source]
-                    target = landmark_screen_coords[cur_target]
-                    face_outline_coords.append((source.get('x'),source.get('y')))
-                    face_outline_coords.append((target.get('x'),target.get('y')))
-
-                # Creating the masked regions 
-                le_mask = np.zeros((frame.shape[0],frame.shape[1]))
-                le_mask = cv.fillConvexPoly(le_mask, np.array(le_screen_coords), 1)
-                le_mask = le_mask.astype(bool)
-
-                re_mask = np.zeros((frame.shape[0],frame.shape[1]))
-                re_mask = cv.fillConvexPoly(re_mask, np.array(re_screen_coords), 1)
-                re_mask = re_mask.astype(bool)
-
-                lip_mask = np.zeros((frame.shape[0],frame.shape[1]))
-                lip_mask = cv.fillConvexPoly(lip_mask, np.array(lips_screen_coords), 1)
-                lip_mask = lip_mask.astype(bool)
-
-                oval_mask = np.zeros((frame.shape[0],frame.shape[1]))
-                oval_mask = cv.fillConvexPoly(oval_mask, np.array(face_outline_coords), 1)
-                oval_mask = oval_mask.astype(bool)
-                
-                # Masking out eye and mouth regions
-                masked_frame = frame
-                masked_frame[le_mask] = 0
-                masked_frame[re_mask] = 0
-                masked_frame[lip_mask] = 0
-
-                # Last step, masking out the bounding face shape
-                face_skin = np.zeros_like(masked_frame)
-                face_skin[oval_mask] = masked_frame[oval_mask] 
-
-                # Removing any face mesh artifacts
-                grey = cv.cvtColor(face_skin, cv.COLOR_BGR2GRAY)
-                white_mask = cv.inRange(grey, 220, 255)
-                face_skin[white_mask == 255] = 0
-
-                result.write(face_skin)
-
-                # Extracting color values and writing to csv
-                if extractColorInfo == True:
-                    bin_mask = np.zeros((frame.shape[0], frame.shape[1]), dtype=np.uint8)
-                    bin_mask[oval_mask] = 255
-                    bin_mask[le_mask] = 0
-                    bin_mask[re_mask] = 0
-                    bin_mask[lip_mask] = 0
-
-                    if colorSpace == COLOR_SPACE_RGB:
-                        blue, green, red, *_ = cv.mean(frame, bin_mask)
-                        timestamp = capture.get(cv.CAP_PROP_POS_MSEC)/1000
-                        csv.write(f"{timestamp:.5f},{red:.5f},{green:.5f},{blue:.5f}\n")
-
-                    elif colorSpace == COLOR_SPACE_HSV:
-                        hue, sat, val, *_ = cv.mean(cv.cvtColor(frame, colorSpace), bin_mask)
-                        timestamp = capture.get(cv.CAP_PROP_POS_MSEC)/1000
-                        csv.write(f"{timestamp:.5f},{hue:.5f},{sat:.5f},{val:.5f}\n")
-                    
-                    elif colorSpace == COLOR_SPACE_GRAYSCALE:
-                        val, *_ = cv.mean(cv.cvtColor(frame, colorSpace), bin_mask)
-                        timestamp = capture.get(cv.CAP_PROP_POS_MSEC)/1000
-                        csv.write(f"{timestamp:.5f},{val:.5f}\n")
-        
-            capture.release()
-            result.release()
-            csv.close()
-    
-    elif maskType == FACE_OVAL:
-
-        for file in files_to_process:
-
-            # Initializing capture and writer objects
-            filename, extension = os.path.splitext(file)
-            capture = cv.VideoCapture(inputDirectory + "\\" + file)
-            size = (int(capture.get(3)), int(capture.get(4)))
-            result = cv.VideoWriter(outputDirectory + "\\Video_Output\\" + filename + "_masked" + extension,
-                                    cv.VideoWriter.fourcc(*'MP4V'), 30, size)
-            csv = None
-
-            if extractColorInfo == True:
-                if colorSpace == COLOR_SPACE_RGB:
-                    csv = open(outputDirectory + "\\CSV_Output\\" + filename + "_RGB.csv", "w")
-                    csv.write("Timestamp,Red,Green,Blue\n")
-                elif colorSpace == COLOR_SPACE_HSV:
-                    csv = open(outputDirectory + "\\CSV_Output\\" + filename + "_HSV.csv", "w")
-                    csv.write("Timestamp,Hue,Saturation,Value\n")
-                elif colorSpace == COLOR_SPACE_GRAYSCALE:
-                    csv = open(outputDirectory + "\\CSV_Output\\" + filename + "_GRAYSCALE.csv", "w")
-                    csv.write("Timestamp,Value\n")
-            
-            while True:
-                success, frame = capture.read()
-                if not success:
-                    break
-
-                face_mesh_results = face_mesh.process(cv.cvtColor(frame, cv.COLOR_BGR2RGB))
-                landmark_screen_coords = []
-
-                if face_mesh_results.multi_face_landmarks:
-                    for face_landmarks in face_mesh_results.multi_face_landmarks:
-
-                        # Convert normalised landmark coordinates to x-y pixel coordinates
-                        for id,lm in enumerate(face_landmarks.landmark):
-                            ih, iw, ic = frame.shape
-                            x,y = int(lm.x * iw), int(lm.y * ih)
-                            landmark_screen_coords.append({'id':id, 'x':x, 'y':y})
-                else:
-                    continue
-
-                face_outline_coords = []
-                
-                # face oval screen coordinates
-                for cur_source, cur_target in FACE_OVAL_PATH:
-                    source = landmark_screen_coords[cur_source]
-                    target = landmark_screen_coords[cur_target]
-                    face_outline_coords.append((source.get('x'),source.get('y')))
-                    face_outline_coords.append((target.get('x'),target.get('y')))
-
-                oval_mask = np.zeros((frame.shape[0],frame.shape[1]))
-                oval_mask = cv.fillConvexPoly(oval_mask, np.array(face_outline_coords), 1)
-                oval_mask = oval_mask.astype(bool)
-
-                # Last step, masking out the bounding face shape
-                face_skin = np.zeros_like(frame)
-                face_skin[oval_mask] = frame[oval_mask] 
-
-                # Removing any face mesh artifacts
-                grey = cv.cvtColor(face_skin, cv.COLOR_BGR2GRAY)
-                white_mask = cv.inRange(grey, 220, 255)
-                face_skin[white_mask == 255] = 0
-
-                result.write(face_skin)
-
-                # Extracting color values and writing to csv
-                if extractColorInfo == True:
-                    bin_mask = np.zeros((frame.shape[0], frame.shape[1]), dtype=np.uint8)
-                    bin_mask[oval_mask] = 255
-
-                    if colorSpace == COLOR_SPACE_RGB:
-                        blue, green, red, *_ = cv.mean(frame, bin_mask)
-                        timestamp = capture.get(cv.CAP_PROP_POS_MSEC)/1000
-                        csv.write(f"{timestamp:.5f},{red:.5f},{green:.5f},{blue:.5f}\n")
-
-                    elif colorSpace == COLOR_SPACE_HSV:
-                        hue, sat, val, *_ = cv.mean(cv.cvtColor(frame, colorSpace), bin_mask)
-                        timestamp = capture.get(cv.CAP_PROP_POS_MSEC)/1000
-                        csv.write(f"{timestamp:.5f},{hue:.5f},{sat:.5f},{val:.5f}\n")
-                    
-                    elif colorSpace == COLOR_SPACE_GRAYSCALE:
-                        val, *_ = cv.mean(cv.cvtColor(frame, colorSpace), bin_mask)
-                        timestamp = capture.get(cv.CAP_PROP_POS_MSEC)/1000
-                        csv.write(f"{timestamp:.5f},{val:.5f}\n")
-        
-            capture.release()
-            result.release()
-            csv.close()
+    # Dispatching one worker process per video; each file is an independent unit
+    # of work, and each worker owns its own FaceMesh instance
+    with multiprocessing.Pool(processes=os.cpu_count()) as pool:
+        pool.starmap(_process_single_video, 
+                     [(file, outputDirectory, maskType, colorSpace, extractColorInfo) 
+                      for file in files_to_process])
 
 COLOR_RED = 3
 COLOR_BLUE = 4
@@ -407,8 +523,15 @@ def get_min_max_rgb(filePath:str, focusColor:int|str = COLOR_RED) -> tuple:
     else:
         raise TypeError("get_min_max_rgb: invalid type for focusColor.")
 
-    capture = cv.VideoCapture(filePath)
-    min_x, min_y, max_x, max_y, min_color, max_color = 0,0,0,0,None,None
+    # Resolving the focus color to a channel index once, rather than re-checking
+    # (and re-lowercasing) focusColor on every frame
+    if isinstance(focusColor, str):
+        channel_index = {"blue":0, "green":1, "red":2}[str.lower(focusColor)]
+    else:
+        channel_index = {COLOR_BLUE:0, COLOR_GREEN:1, COLOR_RED:2}[focusColor]
+
+    capture = _open_capture(filePath)
+    min_color, max_color = None, None
     min_val, max_val = 255, 0
 
     while True:
@@ -417,58 +540,25 @@ def get_min_max_rgb(filePath:str, focusColor:int|str = COLOR_RED) -> tuple:
         if not success:
             break
 
-        blue, green, red = cv.split(frame)
-
-        if focusColor == COLOR_RED or str.lower(focusColor) == "red":
-            max_y = np.where(red == red.max())[0][0]
-            max_x = np.where(red == red.max())[1][0]
-            cur_max_val = red[max_y, max_x]
-
-            min_y = np.where(red == red.min())[0][0]
-            min_x = np.where(red == red.min())[1][0]
-            cur_min_val = red[min_y, min_x]
-
-            if cur_max_val > max_val:
-                max_val = cur_max_val
-                max_color = frame[max_y, max_x]
-
-            if cur_min_val < min_val:
-                min_val = cur_min_val
-                min_color = frame[min_y, min_x]
-
-        elif focusColor == COLOR_BLUE or str.lower(focusColor) == "blue":
-            max_y = np.where(blue == blue.max())[0][0]
-            max_x = np.where(blue == blue.max())[1][0]
-            cur_max_val = blue[max_y, max_x]
-
-            min_y = np.where(blue == blue.min())[0][0]
-            min_x = np.where(blue == blue.min())[1][0]
-            cur_min_val = blue[min_y, min_x]
-
-            if cur_max_val > max_val:
-                max_val = cur_max_val
-                max_color = frame[max_y, max_x]
-
-            if cur_min_val < min_val:
-                min_val = cur_min_val
-                min_color = frame[min_y, min_x]
-        
-        else:
-            max_y = np.where(green == green.max())[0][0]
-            max_x = np.where(green == green.max())[1][0]
-            cur_max_val = green[max_y, max_x]
-
-            min_y = np.where(green == green.min())[0][0]
-            min_x = np.where(green == green.min())[1][0]
-            cur_min_val = green[min_y, min_x]
-
-            if cur_max_val > max_val:
-                max_val = cur_max_val
-                max_color = frame[max_y, max_x]
-
-            if cur_min_val < min_val:
-                min_val = cur_min_val
-                min_color = frame[min_y, min_x]
+        # Zero-copy view of the focus channel; cv.split would materialize all
+        # three planes just to read one of them
+        chan = frame[:, :, channel_index]
+
+        # Locating the channel extrema in a single scan each via argmax/argmin
+        mx = chan.argmax()
+        cur_max_val = chan.flat[mx]
+        mn = chan.argmin()
+        cur_min_val = chan.flat[mn]
+
+        if cur_max_val > max_val:
+            max_val = cur_max_val
+            max_y, max_x = divmod(mx, chan.shape[1])
+            max_color = frame[max_y, max_x]
+
+        if cur_min_val < min_val:
+            min_val = cur_min_val
+            min_y, min_x = divmod(mn, chan.shape[1])
+            min_color = frame[min_y, min_x]
     
     return (min_color, max_color)
 
@@ -502,14 +592,12 @@ def face_color_filter(inputDirectory, outputDirectory, filterColor = COLOR_RED,
     global COLOR_RED
     global COLOR_BLUE
     global COLOR_GREEN
-    global FACE_OVAL_PATH
-    global RIGHT_EYE_PATH
-    global RIGHT_CHEEK_PATH
-    global LEFT_EYE_PATH
-    global LEFT_CHEEK_PATH
-    global LIPS_PATH
-    face_mesh = mp.solutions.face_mesh.FaceMesh(max_num_faces = 1, static_image_mode = False, 
-                                                min_detection_confidence = 0.25, min_tracking_confidence = 0.75)
+    global FACE_OVAL_IDX_ARR
+    global RIGHT_EYE_IDX_ARR
+    global RIGHT_CHEEK_IDX_ARR
+    global LEFT_EYE_IDX_ARR
+    global LEFT_CHEEK_IDX_ARR
+    global LIPS_IDX_ARR
     
     # Performing checks on function parameters
     if not isinstance(inputDirectory, str):
@@ -533,157 +621,239 @@ def face_color_filter(inputDirectory, outputDirectory, filterColor = COLOR_RED,
     # Creating a list of file names to iterate through when processing
     files_to_process = []
     if not withSubDirectories:
-         files_to_process = os.listdir(inputDirectory)
+         files_to_process = [os.path.join(inputDirectory, file) for file in os.listdir(inputDirectory)]
     else:
         ### TODO remove if file[0:2] ... after processing
         files_to_process = [os.path.join(path, file) 
                             for path, dirs, files in os.walk(inputDirectory, topdown=True) 
                             for file in files if file[0:2] == "02"]
     
-    for file in files_to_process:
-            
-        # Initialize capture and writer objects
-        filename, extension = os.path.splitext(os.path.basename(file))
-        capture = cv.VideoCapture(file)
-        size = (int(capture.get(3)), int(capture.get(4)))
-        result = cv.VideoWriter(outputDirectory + "\\" + filename + "_color_filter.mp4",
-                                cv.VideoWriter.fourcc(*'MP4V'), 30, size)
-            
-        while True:
-
-            success, frame = capture.read()
-            if not success:
-                break    
-
-            face_mesh_results = face_mesh.process(cv.cvtColor(frame, cv.COLOR_BGR2RGB))
-            landmark_screen_coords = []
-
-            if face_mesh_results.multi_face_landmarks:
-                for face_landmarks in face_mesh_results.multi_face_landmarks:
-
-                    # Convert normalised landmark coordinates to x-y pixel coordinates
-                    for id,lm in enumerate(face_landmarks.landmark):
-                        ih, iw, ic = frame.shape
-                        x,y = int(lm.x * iw), int(lm.y * ih)
-                        landmark_screen_coords.append({'id':id, 'x':x, 'y':y})
-            else:
-                continue
-
-            le_screen_coords = []
-            #lc_screen_coords = []
-            re_screen_coords = []
-            #rc_screen_coords = []
-            lips_screen_coords = []
-            face_outline_coords = []
-
-            # Left eye screen coordinates
-            for cur_source, cur_target in LEFT_EYE_PATH:
-                source = landmark_screen_coords[cur_source]
-                target = landmark_screen_coords[cur_target]
-                le_screen_coords.append((source.get('x'),source.get('y')))
-                le_screen_coords.append((target.get('x'),target.get('y')))
-            
-            # Left cheek screen coordinates
-            #for cur_source, cur_target in LEFT_CHEEK_PATH:
-            #    source = landmark_screen_coords[cur_source]
-            #    target = landmark_screen_coords[cur_target]
-            #    lc_screen_coords.append((source.get('x'),source.get('y')))
-            #    lc_screen_coords.append((target.get('x'),target.get('y')))
-            
-            # Right eye screen coordinates
-            for cur_source, cur_target in RIGHT_EYE_PATH:
-                source = landmark_screen_coords[cur_source]
-                target = landmark_screen_coords[cur_target]
-                re_screen_coords.append((source.get('x'),source.get('y')))
-                re_screen_coords.append((target.get('x'),target.get('y')))
-            
-            # Right cheek screen coordinates
-            #for cur_source, cur_target in RIGHT_CHEEK_PATH:
-            #    source = landmark_screen_coords[cur_source]
-            #    target = landmark_screen_coords[cur_target]
-            #    rc_screen_coords.append((source.get('x'),source.get('y')))
-            #    rc_screen_coords.append((target.get('x'),target.get('y')))
-
-            # Lips screen coordinates
-            for cur_source, cur_target in LIPS_PATH:
-                source = landmark_screen_coords[cur_source]
-                target = landmark_screen_coords[cur_target]
-                lips_screen_coords.append((source.get('x'),source.get('y')))
-                lips_screen_coords.append((target.get('x'),target.get('y')))
-            
-            # Face oval screen coordinates
-            for cur_source, cur_target in FACE_OVAL_PATH:
-                source = landmark_screen_coords[cur_source]
-                target = landmark_screen_coords[cur_target]
-                face_outline_coords.append((source.get('x'),source.get('y')))
-                face_outline_coords.append((target.get('x'),target.get('y')))
-
-            # Creating masked regions 
-            le_mask = np.zeros((frame.shape[0],frame.shape[1]), dtype=np.uint8)
-            le_mask = cv.fillConvexPoly(le_mask, np.array(le_screen_coords), 1)
-            le_mask = le_mask.astype(bool)
-
-            #lc_mask = np.zeros((frame.shape[0],frame.shape[1]), dtype=np.uint8)
-            #lc_mask = cv.fillConvexPoly(lc_mask, np.array(lc_screen_coords), 1)
-            #lc_mask = lc_mask.astype(bool)
-
-            re_mask = np.zeros((frame.shape[0],frame.shape[1]), dtype=np.uint8)
-            re_mask = cv.fillConvexPoly(re_mask, np.array(re_screen_coords), 1)
-            re_mask = re_mask.astype(bool)
-
-            #rc_mask = np.zeros((frame.shape[0],frame.shape[1]), dtype=np.uint8)
-            #rc_mask = cv.fillConvexPoly(rc_mask, np.array(rc_screen_coords), 1)
-            #rc_mask = rc_mask.astype(bool)
-
-            lip_mask = np.zeros((frame.shape[0],frame.shape[1]), dtype=np.uint8)
-            lip_mask = cv.fillConvexPoly(lip_mask, np.array(lips_screen_coords), 1)
-            lip_mask = lip_mask.astype(bool)
-
-            oval_mask = np.zeros((frame.shape[0],frame.shape[1]), dtype=np.uint8)
-            oval_mask = cv.fillConvexPoly(oval_mask, np.array(face_outline_coords), 1)
-            oval_mask = oval_mask.astype(bool)
-
-            # Isolating overall face skin and cheeks for colouring
-            face_mask = np.zeros(frame.shape[:2], dtype=np.uint8)
-            face_mask[oval_mask] = 255
-            face_mask[le_mask] = 0
-            face_mask[re_mask] = 0
-            face_mask[lip_mask] = 0
-
-            #cheek_mask = np.zeros(frame.shape[:2], dtype=np.uint8)
-            #cheek_mask[rc_mask] = 255
-            #cheek_mask[lc_mask] = 255
-
-            # Cleaning up masks with morphological operations
-            kernel = cv.getStructuringElement(cv.MORPH_RECT, (3,3))
-
-            face_mask = cv.morphologyEx(face_mask, cv.MORPH_OPEN, kernel)
-            face_mask = cv.morphologyEx(face_mask, cv.MORPH_CLOSE, kernel)
-            face_mask = cv.cvtColor(face_mask, cv.COLOR_GRAY2BGR)
-
-            #cheek_mask = cv.morphologyEx(cheek_mask, cv.MORPH_OPEN, kernel)
-            #cheek_mask = cv.morphologyEx(cheek_mask, cv.MORPH_CLOSE, kernel)
-            #cheek_mask = cv.cvtColor(cheek_mask, cv.COLOR_GRAY2BGR)
-
-            # Colouring masked regions
-            if filterColor == COLOR_RED:
-                masked_img = np.copy(frame)
-                masked_img[(face_mask == 255).all(-1)] = [0,0,255]
-
-                cv.addWeighted(masked_img, alpha, frame, 1, 0, frame)
-
-            elif filterColor == COLOR_BLUE:
-                masked_img = np.copy(frame)
-                masked_img[(face_mask == 255).all(-1)] = [255,0,0]
-
-                cv.addWeighted(masked_img, alpha, frame, 1, 0, frame)
+    # A single FaceMesh instance is shared across all files, and released once
+    # processing completes
+    with mp.solutions.face_mesh.FaceMesh(max_num_faces = 1, static_image_mode = False,
+                                         min_detection_confidence = 0.25, min_tracking_confidence = 0.75) as face_mesh:
+
+        # The morphology kernel never changes, so it is built once up front rather
+        # than once per frame
+        kernel = cv.getStructuringElement(cv.MORPH_RECT, (3,3))
+
+        # Tinting runs on a pool of worker threads; the main loop submits one task
+        # per frame and enqueues the resulting Future, and the writer thread
+        # resolves them in submission order. Each pool thread keeps its own scratch
+        # buffer for the fallback blend, as tasks may run concurrently
+        tint_pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+        tint_tls = threading.local()
+
+        # The decode and encode stages are each tied to a core of their own so
+        # their buffers stay in a warm cache. The tint pool and Numba's parallel
+        # runtime are deliberately left to the scheduler: spawned threads inherit
+        # the affinity of the thread that creates them, so pinning the main thread
+        # would confine them to a single core
+        if hasattr(os, "sched_getaffinity"):
+            cores = sorted(os.sched_getaffinity(0))
+        else:
+            cores = list(range(os.cpu_count() or 1))
+        reader_core = cores[0]
+        writer_core = cores[-1]
+
+        # filterColor never changes within a call, so the output colour is resolved
+        # once up front; unrecognised values fall back to green, matching the old
+        # else branch
+        bgr = {COLOR_RED: (0,0,255), COLOR_BLUE: (255,0,0)}.get(filterColor, (0,255,0))
+
+        # The blend is a per-channel affine map of the input value -- the original
+        # addWeighted weights of 1 for the frame and alpha for the colour, with
+        # saturation -- so the fallback path precomputes it as a 256-entry lookup
+        # table per channel; cv.LUT then applies all three in one call
+        if not NUMBA_AVAILABLE:
+            v = np.arange(256, dtype=np.float64)
+            tint_lut = np.dstack([np.clip(v + alpha * c + 0.5, 0, 255) for c in bgr]).astype(np.uint8)
+
+        # Per-frame tint task submitted to the pool; the JIT kernel tints the
+        # frame in place, while the fallback writes the lookup result into its
+        # thread's scratch buffer and copies it back under the mask, so both
+        # paths leave the frame modified in place with no per-frame allocation
+        def _tint_task(frame, face_mask, rect):
+            if NUMBA_AVAILABLE:
+                # Only the face bounding box is traversed; the kernel signature
+                # accepts the non-contiguous views
+                x, y, w, h = rect
+                _tint_kernel(frame[y:y+h, x:x+w], face_mask[y:y+h, x:x+w],
+                             bgr[0], bgr[1], bgr[2], alpha)
             else:
-                masked_img = np.copy(frame)
-                masked_img[(face_mask == 255).all(-1)] = [0,255,0]
+                # The lookup and masked copy also only touch the bounding box;
+                # the scratch buffer is flat so any ROI shape can be carved out
+                # of it contiguously
+                x, y, w, h = rect
+                roi = frame[y:y+h, x:x+w]
+                scratch = getattr(tint_tls, "scratch", None)
+                if scratch is None or scratch.size < roi.size:
+                    scratch = np.empty(roi.size, dtype=np.uint8)
+                    tint_tls.scratch = scratch
+                blended = scratch[:roi.size].reshape(roi.shape)
+                cv.LUT(roi, tint_lut, blended)
+                cv.copyTo(blended, face_mask[y:y+h, x:x+w], roi)
+            return frame
 
-                cv.addWeighted(masked_img, alpha, frame, 1, 0, frame)
-            
-            result.write(frame)
+        for file in files_to_process:
 
-        capture.release()
-        result.release()
\ No newline at end of file
+            # Initialize capture and writer objects
+            filename, extension = os.path.splitext(os.path.basename(file))
+            capture = _open_capture(file)
+            size = (int(capture.get(3)), int(capture.get(4)))
+            result = cv.VideoWriter(os.path.join(outputDirectory, filename + "_color_filter.mp4"),
+                                    cv.CAP_FFMPEG, cv.VideoWriter.fourcc(*'MP4V'), 30, size)
+
+            # FaceMesh landmarks are normalised to [0,1], so detection can run on a
+            # downscaled copy without changing any of the pixel-coordinate math below
+            detect_size = None
+            if size[0] > 640:
+                detect_size = (640, int(size[1] * 640 / size[0]))
+
+            # Reusable half-resolution region mask buffers; cleared at the top of
+            # each frame rather than reallocated. face_mask itself is produced
+            # fresh by the bitwise fusion, so these are never shared with a
+            # still-running tint task
+            half_h, half_w = size[1] // 2, size[0] // 2
+            le_mask = np.zeros((half_h, half_w), dtype=np.uint8)
+            #lc_mask = np.zeros((half_h, half_w), dtype=np.uint8)
+            re_mask = np.zeros((half_h, half_w), dtype=np.uint8)
+            #rc_mask = np.zeros((half_h, half_w), dtype=np.uint8)
+            lip_mask = np.zeros((half_h, half_w), dtype=np.uint8)
+            oval_mask = np.zeros((half_h, half_w), dtype=np.uint8)
+
+            # Decoding and encoding each run on their own thread so capture.read and
+            # VideoWriter.write do not block detection and tinting; the bounded
+            # queues cap frames held in memory. Decoded frames are owned by the
+            # writer once queued, and are never touched again by the main loop
+            read_queue = queue.Queue(maxsize=8)
+            write_queue = queue.Queue(maxsize=8)
+            writer_errors = []
+
+            def _pinned_reader():
+                _pin_thread_to_core(reader_core)
+                _frame_reader(capture, read_queue)
+
+            def _pinned_writer():
+                _pin_thread_to_core(writer_core)
+                _frame_writer(result, write_queue, writer_errors)
+
+            reader_thread = threading.Thread(target=_pinned_reader)
+            writer_thread = threading.Thread(target=_pinned_writer)
+            reader_thread.start()
+            writer_thread.start()
+
+            # The pipeline threads must be unblocked and joined, and the handles
+            # released, even when the loop below raises; errors the writer hit
+            # while tinting or encoding are then re-raised here
+            eof = False
+            try:
+                while True:
+
+                    item = read_queue.get()
+                    if item is None:
+                        eof = True
+                        break
+                    # The filter has no use for the timestamp half of the pair
+                    _, frame = item
+
+                    rgb_frame = cv.cvtColor(frame, cv.COLOR_BGR2RGB)
+                    if detect_size is not None:
+                        rgb_frame = cv.resize(rgb_frame, detect_size, interpolation=cv.INTER_AREA)
+                    face_mesh_results = face_mesh.process(rgb_frame)
+
+                    if not face_mesh_results.multi_face_landmarks:
+                        continue
+
+                    # Convert normalised landmark coordinates to x-y pixel coordinates in
+                    # one vectorized operation
+                    ih, iw, ic = frame.shape
+                    landmarks = face_mesh_results.multi_face_landmarks[0].landmark
+                    pts_px = np.fromiter((c for lm in landmarks for c in (lm.x, lm.y)), 
+                                         dtype=np.float32, count=len(landmarks)*2).reshape(-1, 2)
+                    pts_px *= (iw, ih)
+                    pts_px = pts_px.astype(np.int32)
+
+                    # Region masks are rasterized and cleaned at half resolution; the
+                    # tint edge tolerates the ~1px coarsening, and fills, bitwise ops and
+                    # morphology all run over a quarter of the pixels
+                    pts_half = pts_px // 2
+
+                    le_screen_coords = pts_half[LEFT_EYE_IDX_ARR]
+                    #lc_screen_coords = pts_half[LEFT_CHEEK_IDX_ARR]
+                    re_screen_coords = pts_half[RIGHT_EYE_IDX_ARR]
+                    #rc_screen_coords = pts_half[RIGHT_CHEEK_IDX_ARR]
+                    lips_screen_coords = pts_half[LIPS_IDX_ARR]
+                    face_outline_coords = pts_half[FACE_OVAL_IDX_ARR]
+
+                    # Creating masked regions in the reusable buffers
+                    le_mask.fill(0)
+                    cv.fillConvexPoly(le_mask, le_screen_coords, 255)
+
+                    #lc_mask.fill(0)
+                    #cv.fillConvexPoly(lc_mask, lc_screen_coords, 255)
+
+                    re_mask.fill(0)
+                    cv.fillConvexPoly(re_mask, re_screen_coords, 255)
+
+                    #rc_mask.fill(0)
+                    #cv.fillConvexPoly(rc_mask, rc_screen_coords, 255)
+
+                    lip_mask.fill(0)
+                    cv.fillConvexPoly(lip_mask, lips_screen_coords, 255)
+
+                    oval_mask.fill(0)
+                    cv.fillConvexPoly(oval_mask, face_outline_coords, 255)
+
+                    # Isolating overall face skin for colouring: face oval minus the eye and
+                    # mouth regions, fused with vectorized bitwise operations
+                    cv.bitwise_or(le_mask, re_mask, le_mask)
+                    cv.bitwise_or(le_mask, lip_mask, le_mask)
+                    face_mask = cv.bitwise_and(oval_mask, cv.bitwise_not(le_mask))
+
+                    #cheek_mask = cv.bitwise_or(rc_mask, lc_mask)
+
+                    # Cleaning up masks with morphological operations
+                    face_mask = cv.morphologyEx(face_mask, cv.MORPH_OPEN, kernel)
+                    face_mask = cv.morphologyEx(face_mask, cv.MORPH_CLOSE, kernel)
+
+                    #cheek_mask = cv.morphologyEx(cheek_mask, cv.MORPH_OPEN, kernel)
+                    #cheek_mask = cv.morphologyEx(cheek_mask, cv.MORPH_CLOSE, kernel)
+
+                    # If morphology wiped the mask out entirely there is nothing to
+                    # tint; pass the frame straight to the writer. The count runs on the
+                    # half-resolution mask, before the upsample is paid for
+                    if cv.countNonZero(face_mask) == 0:
+                        write_queue.put(frame)
+                        continue
+
+                    # The face bounding box bounds all the tint work; measured on the
+                    # half-resolution mask, scaled back up with a pixel of slack for
+                    # the rounding, and clamped to the frame
+                    x, y, w, h = cv.boundingRect(face_mask)
+                    x, y = max(2*x - 2, 0), max(2*y - 2, 0)
+                    w, h = min(2*w + 4, iw - x), min(2*h + 4, ih - y)
+
+                    # Upsampling the cleaned mask back to frame resolution; nearest-
+                    # neighbour interpolation keeps it strictly 0/255
+                    face_mask = cv.resize(face_mask, (iw, ih), interpolation=cv.INTER_NEAREST)
+
+                    # Colouring the masked region on the tint pool; the frame and its
+                    # mask are owned by the task (and then the writer) once submitted
+                    write_queue.put(tint_pool.submit(_tint_task, frame, face_mask, (x, y, w, h)))
+            finally:
+                if not eof:
+                    # The loop exited early; drain the reader to its sentinel so it
+                    # is never left blocked on a full queue
+                    while read_queue.get() is not None:
+                        pass
+                write_queue.put(None)
+                reader_thread.join()
+                writer_thread.join()
+                capture.release()
+                result.release()
+
+            if writer_errors:
+                raise writer_errors[0]
+
+        tint_pool.shutdown()
\ No newline at end of file
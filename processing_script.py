@@ -5,6 +5,10 @@ import os
 in_dir = "C:\\Users\\gavin\\Desktop\\OpenCV\\Video_Speech_Actors_01-24\\Video_Speech_Actor_01\\Actor_01\\01-01-01-01-01-01-01.mp4"
 out_dir = os.getcwd()
 
-#min, max = fi.get_min_max_rgb(in_dir, "red")
-#fi.mask_face_region(in_dir, out_dir, fi.FACE_SKIN_ISOLATION, True, True, fi.COLOR_SPACE_RGB)
-#fi.face_color_filter(in_dir, out_dir, fi.COLOR_BLUE, withSubDirectories=True)
+# The __main__ guard is required now that mask_face_region dispatches worker
+# processes via multiprocessing
+if __name__ == "__main__":
+    pass
+    #min, max = fi.get_min_max_rgb(in_dir, "red")
+    #fi.mask_face_region(in_dir, out_dir, fi.FACE_SKIN_ISOLATION, True, True, fi.COLOR_SPACE_RGB)
+    #fi.face_color_filter(in_dir, out_dir, fi.COLOR_BLUE, withSubDirectories=True)